@@ -0,0 +1,20 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("numba not installed, JIT kernels will run as plain Python")
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is unavailable"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
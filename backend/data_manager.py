@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 import logging
 import sqlite3
 import json
+import time
 from robinhood_client import RobinhoodClient
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,8 @@ class DataManager:
             'LTC': 'LTC-USD',
             'BCH': 'BCH-USD'
         }
+        self.trading_pairs_ttl = 3600  # seconds
+        self._pair_cache: Optional[Tuple[float, List[Dict]]] = None
     
     def init_database(self):
         """Initialize SQLite database for storing market data"""
@@ -65,7 +68,12 @@ class DataManager:
         conn.close()
     
     def get_trading_pairs(self) -> List[Dict]:
-        """Get available trading pairs from Robinhood"""
+        """Get available trading pairs from Robinhood, reusing the last listing for trading_pairs_ttl seconds"""
+        if self._pair_cache is not None:
+            cached_at, cached_pairs = self._pair_cache
+            if time.monotonic() - cached_at < self.trading_pairs_ttl:
+                return cached_pairs
+        
         try:
             pairs = self.robinhood_client.get_trading_pairs()
             
@@ -91,6 +99,9 @@ class DataManager:
             conn.commit()
             conn.close()
             
+            if pairs:
+                self._pair_cache = (time.monotonic(), pairs)
+            
             return pairs
         
         except Exception as e:
@@ -129,10 +140,15 @@ class DataManager:
         period: str = "3mo", 
         interval: str = "1h"
     ) -> pd.DataFrame:
-        """Get historical data using yfinance as fallback"""
+        """Get historical data, serving stored bars first and using yfinance as fallback"""
         try:
             df = self.get_stored_data(symbol, period)
             if not df.empty and len(df) > 50:
+                try:
+                    if self._fetch_missing_bars(symbol, interval):
+                        df = self.get_stored_data(symbol, period)
+                except Exception as e:
+                    logger.warning(f"Could not top up stored data for {symbol}, serving stored bars: {e}")
                 return df
             
             yahoo_symbol = self.symbol_mapping.get(symbol, f"{symbol}-USD")
@@ -144,8 +160,8 @@ class DataManager:
                 logger.warning(f"No historical data found for {symbol}")
                 return pd.DataFrame()
             
-            hist.columns = [col.lower() for col in hist.columns]
             hist.reset_index(inplace=True)
+            hist.columns = [col.lower() for col in hist.columns]
             
             self.store_market_data(symbol, hist, "yfinance")
             
@@ -155,26 +171,76 @@ class DataManager:
             logger.error(f"Error fetching historical data for {symbol}: {e}")
             return pd.DataFrame()
     
+    def _fetch_missing_bars(self, symbol: str, interval: str) -> bool:
+        """Download the bars from the last stored yfinance bar onward; returns True if any were stored
+        
+        The last stored bar is refetched because yfinance's newest row is the bar still in progress,
+        so INSERT OR REPLACE completes it once the hour has closed.
+        """
+        try:
+            bar_length = pd.to_timedelta(interval)
+        except ValueError:
+            return False
+        
+        conn = sqlite3.connect(self.db_path)
+        last_timestamp = conn.execute(
+            'SELECT MAX(timestamp) FROM market_data WHERE symbol = ? AND source = ?',
+            (symbol, "yfinance")
+        ).fetchone()[0]
+        conn.close()
+        
+        if last_timestamp is None:
+            return False
+        
+        last_bar = pd.Timestamp(last_timestamp)
+        if datetime.now() - last_bar < bar_length:
+            return False
+        
+        # Stored timestamps are naive local time; yfinance would read a naive start in the exchange timezone
+        start = pd.Timestamp(last_bar.to_pydatetime().astimezone()).tz_convert('UTC')
+        yahoo_symbol = self.symbol_mapping.get(symbol, f"{symbol}-USD")
+        hist = yf.Ticker(yahoo_symbol).history(start=start, interval=interval)
+        if hist.empty:
+            return False
+        
+        hist.reset_index(inplace=True)
+        hist.columns = [col.lower() for col in hist.columns]
+        self.store_market_data(symbol, hist, "yfinance")
+        return True
+    
+    @staticmethod
+    def _to_db_timestamp(value) -> str:
+        """Normalize a timestamp to the naive local-time ISO string stored in market_data"""
+        timestamp = pd.Timestamp(value).to_pydatetime()
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone().replace(tzinfo=None)
+        return timestamp.isoformat(sep=' ')
+    
     def store_market_data(self, symbol: str, data: pd.DataFrame, source: str):
         """Store market data in database"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            if 'datetime' in data.columns:
+                timestamps = data['datetime']
+            elif 'date' in data.columns:
+                timestamps = data['date']
+            else:
+                timestamps = data.index
             
-            for _, row in data.iterrows():
-                conn.execute('''
-                    INSERT OR REPLACE INTO market_data 
-                    (symbol, timestamp, open, high, low, close, volume, source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    symbol,
-                    row.get('datetime', row.name),
-                    row.get('open'),
-                    row.get('high'),
-                    row.get('low'),
-                    row.get('close'),
-                    row.get('volume'),
-                    source
-                ))
+            columns = [
+                data[col].tolist() if col in data.columns else [None] * len(data)
+                for col in ('open', 'high', 'low', 'close', 'volume')
+            ]
+            rows = [
+                (symbol, self._to_db_timestamp(timestamp), *values, source)
+                for timestamp, *values in zip(timestamps, *columns)
+            ]
+            
+            conn = sqlite3.connect(self.db_path)
+            conn.executemany('''
+                INSERT OR REPLACE INTO market_data 
+                (symbol, timestamp, open, high, low, close, volume, source)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
             
             conn.commit()
             conn.close()
@@ -182,8 +248,8 @@ class DataManager:
         except Exception as e:
             logger.error(f"Error storing market data: {e}")
     
-    def get_stored_data(self, symbol: str, period: str = "3mo") -> pd.DataFrame:
-        """Get stored market data from database"""
+    def get_stored_data(self, symbol: str, period: str = "3mo", source: str = "yfinance") -> pd.DataFrame:
+        """Get stored market data for one source (historical bars by default, not real-time ticks)"""
         try:
             end_date = datetime.now()
             if period == "1mo":
@@ -202,15 +268,18 @@ class DataManager:
             query = '''
                 SELECT timestamp, open, high, low, close, volume
                 FROM market_data 
-                WHERE symbol = ? AND timestamp >= ? AND timestamp <= ?
+                WHERE symbol = ? AND source = ? AND timestamp >= ? AND timestamp <= ?
                 ORDER BY timestamp
             '''
             
-            df = pd.read_sql_query(query, conn, params=(symbol, start_date, end_date))
+            df = pd.read_sql_query(
+                query, conn,
+                params=(symbol, source, self._to_db_timestamp(start_date), self._to_db_timestamp(end_date))
+            )
             conn.close()
             
             if not df.empty:
-                df['datetime'] = pd.to_datetime(df['timestamp'])
+                df['datetime'] = pd.to_datetime(df['timestamp'], format='ISO8601')
                 df.set_index('datetime', inplace=True)
             
             return df
@@ -251,6 +320,28 @@ class DataManager:
             logger.error(f"Error updating real-time data: {e}")
             return {}
     
+    def get_last_completed_ohlc(self, symbol: str, source: str = "yfinance") -> Optional[Tuple[str, float, float, float]]:
+        """Get the timestamp, high, low and close of the newest completed stored bar for a symbol
+        
+        The newest stored yfinance row is the bar still in progress, so this returns the one before it.
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            row = conn.execute(
+                'SELECT timestamp, high, low, close FROM market_data '
+                'WHERE symbol = ? AND source = ? ORDER BY timestamp DESC LIMIT 1 OFFSET 1',
+                (symbol, source)
+            ).fetchone()
+            conn.close()
+            
+            if row is None or None in row:
+                return None
+            return row
+        
+        except Exception as e:
+            logger.error(f"Error retrieving latest bar for {symbol}: {e}")
+            return None
+    
     def get_latest_price(self, symbol: str) -> Optional[float]:
         """Get the latest price for a symbol"""
         prices = self.get_current_prices([symbol])
@@ -266,7 +357,7 @@ class DataManager:
             
             cursor.execute(
                 'DELETE FROM market_data WHERE timestamp < ?', 
-                (cutoff_date,)
+                (self._to_db_timestamp(cutoff_date),)
             )
             
             deleted_rows = cursor.rowcount
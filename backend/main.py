@@ -1,5 +1,6 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, List, Optional, Any
 import os
@@ -77,7 +78,7 @@ async def health_check():
 @app.post("/api/bot/start")
 async def start_bot(request: BotStartRequest):
     """Start the trading bot"""
-    global trading_bot
+    global trading_bot, bot_monitor
     
     try:
         api_key = os.getenv("ROBINHOOD_API_KEY")
@@ -89,19 +90,26 @@ async def start_bot(request: BotStartRequest):
                 detail="Robinhood API credentials not configured"
             )
         
+        if trading_bot:
+            if trading_bot.is_running:
+                await trading_bot.stop()
+            await trading_bot.robinhood_client.aclose()
+        
         trading_bot = TradingBot(
             api_key=api_key,
             private_key=private_key,
             account_balance=request.account_balance,
             symbols=request.symbols
         )
+        # The monitor must not keep driving the replaced bot, whose client is now closed
+        if bot_monitor:
+            bot_monitor.trading_bot = trading_bot
         
         result = await trading_bot.start()
         
         if result['status'] == 'error':
             raise HTTPException(status_code=400, detail=result['message'])
         
-        global bot_monitor
         if not bot_monitor:
             bot_monitor = TradingBotMonitor(trading_bot)
             asyncio.create_task(bot_monitor.start_monitoring())
@@ -172,7 +180,7 @@ async def get_portfolio():
         raise HTTPException(status_code=400, detail="Bot is not initialized")
     
     try:
-        return trading_bot.get_portfolio()
+        return await trading_bot.get_portfolio()
     
     except Exception as e:
         logger.error(f"Failed to get portfolio: {e}")
@@ -185,7 +193,8 @@ async def get_trade_history(limit: int = 50):
         raise HTTPException(status_code=400, detail="Bot is not initialized")
     
     try:
-        return trading_bot.get_trade_history(limit)
+        # orjson serializes the slotted TradeRecord dataclasses and their datetimes directly
+        return ORJSONResponse(trading_bot.get_trade_history(limit))
     
     except Exception as e:
         logger.error(f"Failed to get trade history: {e}")
@@ -296,6 +305,12 @@ async def startup_event():
     logger.info("Starting Robinhood Crypto Trading Bot API")
     asyncio.create_task(run_trading_cycles())
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled API connections"""
+    if trading_bot:
+        await trading_bot.robinhood_client.aclose()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -18,6 +18,9 @@ class TradingBotMonitor:
         self.max_errors = 5
         self.restart_threshold = timedelta(minutes=30)
         self.monitoring = False
+        self.max_restart_backoff = 300  # seconds
+        self._restart_attempts = 0
+        self._restart_lock = asyncio.Lock()
 
     async def start_monitoring(self):
         """Start the monitoring loop"""
@@ -52,6 +55,7 @@ class TradingBotMonitor:
                 if time_since_success > self.restart_threshold:
                     logger.warning("Bot appears unresponsive, attempting restart")
                     await self.restart_bot()
+                    return
                 
                 try:
                     account_info = await self.trading_bot.robinhood_client.get_account()
@@ -70,30 +74,46 @@ class TradingBotMonitor:
             logger.error(f"Health monitoring error: {e}")
 
     async def restart_bot(self):
-        """Restart the trading bot"""
-        try:
-            logger.info("Attempting to restart trading bot")
-            
-            if self.trading_bot.is_running:
-                await self.trading_bot.stop()
-                await asyncio.sleep(5)
-            
-            result = await self.trading_bot.start()
-            
-            if result.get('status') == 'success':
-                self.last_successful_cycle = datetime.now()
-                self.error_count = 0
-                logger.info("Bot restarted successfully")
-            else:
+        """Restart the trading bot, allowing only one restart in flight"""
+        if self._restart_lock.locked():
+            logger.info("Restart already in progress, skipping")
+            return
+        
+        async with self._restart_lock:
+            try:
+                logger.info("Attempting to restart trading bot")
+                
+                backoff = min(self.max_restart_backoff, 5 * 2 ** self._restart_attempts)
+                self._restart_attempts += 1
+                
+                if self.trading_bot.is_running:
+                    await self.trading_bot.stop()
+                await asyncio.sleep(backoff)
+                
+                result = await self.trading_bot.start()
+                
+                if result.get('status') != 'success':
+                    self.error_count += 1
+                    logger.error(f"Bot restart failed: {result.get('message', 'Unknown error')}")
+                    return
+                
+                # Half-open: a single probe must succeed before the bot is considered healthy
+                probe = await self.trading_bot.robinhood_client.get_account()
+                if probe:
+                    self.last_successful_cycle = datetime.now()
+                    self.error_count = 0
+                    self._restart_attempts = 0
+                    logger.info("Bot restarted successfully")
+                else:
+                    self.error_count += 1
+                    logger.error("Bot restarted but health probe returned no account data")
+                    
+            except Exception as e:
                 self.error_count += 1
-                logger.error(f"Bot restart failed: {result.get('message', 'Unknown error')}")
+                logger.error(f"Bot restart failed: {e}")
                 
-        except Exception as e:
-            self.error_count += 1
-            logger.error(f"Bot restart failed: {e}")
-            
-            if self.error_count >= self.max_errors:
-                logger.critical("Maximum restart attempts reached, manual intervention required")
+                if self.error_count >= self.max_errors:
+                    logger.critical("Maximum restart attempts reached, manual intervention required")
 
     def update_last_successful_cycle(self):
         """Update the last successful cycle timestamp"""
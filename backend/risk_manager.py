@@ -1,4 +1,3 @@
-import pandas as pd
 import numpy as np
 from typing import Dict, Optional, Tuple
 import logging
@@ -48,6 +47,10 @@ class RiskManager:
         """Calculate position size using ATR-based risk management"""
         self.reset_daily_limits()
         
+        if self.account_balance <= 0:
+            logger.warning("Account balance unavailable, skipping position sizing")
+            return 0.0
+        
         if self.daily_losses >= self.account_balance * self.daily_loss_limit:
             logger.warning("Daily loss limit reached")
             return 0.0
@@ -200,35 +203,5 @@ class RiskManager:
             'open_positions': len(self.open_positions),
             'total_position_value': total_position_value,
             'available_buying_power': self.account_balance - total_position_value,
-            'risk_utilization': total_position_value / self.account_balance
+            'risk_utilization': total_position_value / self.account_balance if self.account_balance > 0 else 0.0
         }
-    
-    def update_trailing_stop(
-        self, 
-        symbol: str, 
-        current_price: float, 
-        atr: float
-    ) -> Optional[float]:
-        """Update trailing stop loss for open position"""
-        if symbol not in self.open_positions:
-            return None
-        
-        position = self.open_positions[symbol]
-        side = position['side']
-        
-        new_stop = self.calculate_atr_stop_loss(current_price, atr, side)
-        
-        if 'stop_loss' not in position:
-            position['stop_loss'] = new_stop
-            return new_stop
-        
-        current_stop = position['stop_loss']
-        
-        if side == 'buy' and new_stop > current_stop:
-            position['stop_loss'] = new_stop
-            return new_stop
-        elif side == 'sell' and new_stop < current_stop:
-            position['stop_loss'] = new_stop
-            return new_stop
-        
-        return current_stop
@@ -1,52 +1,100 @@
 import base64
-import datetime
-import json
-from typing import Any, Dict, Optional, List
+import binascii
+from typing import Any, Dict, Optional, List, Tuple
 import uuid
+import asyncio
+import httpx
+import orjson
 import requests
-from nacl.signing import SigningKey
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+import threading
 import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+class RobinhoodAPIError(Exception):
+    """Raised when a Robinhood API request fails or returns an unreadable response"""
+
+
 class RobinhoodClient:
     """
     Official Robinhood API client for cryptocurrency trading
     Following the documentation at https://docs.robinhood.com/crypto/trading/
     """
     
-    def __init__(self, api_key: str, private_key_base64: str):
+    def __init__(
+        self,
+        api_key: str,
+        private_key_base64: str,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         self.api_key = api_key
         private_key_seed = base64.b64decode(private_key_base64)
-        self.private_key = SigningKey(private_key_seed)
+        self.private_key = Ed25519PrivateKey.from_private_bytes(private_key_seed)
         self.base_url = "https://trading.robinhood.com"
+        self.session = requests.Session()
+        self.session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=20))
+        # Account and order endpoints are async and share one pooled HTTP/2 connection
+        self.http_client = http_client or httpx.AsyncClient(
+            http2=True, limits=httpx.Limits(max_connections=32), timeout=30
+        )
         self.last_request_time = 0
+        self._rate_lock = threading.Lock()
         self.min_request_interval = 0.6  # Rate limiting: 100 req/min
+        self.signature_reuse_s = 5.0  # Reuse GET signatures within the API's timestamp window
+        self._sig_cache: Dict[Tuple[str, str], Tuple[float, str, str]] = {}
     
     def _rate_limit(self):
-        """Ensure we don't exceed rate limits"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last)
-        self.last_request_time = time.time()
-    
-    def _generate_signature(self, method: str, path: str, body: str, timestamp: str) -> str:
+        """Ensure we don't exceed rate limits; safe to call from worker threads"""
+        with self._rate_lock:
+            current_time = time.time()
+            wait = max(0.0, self.last_request_time + self.min_request_interval - current_time)
+            self.last_request_time = current_time + wait
+        if wait:
+            time.sleep(wait)
+    
+    async def _async_rate_limit(self):
+        """Non-blocking _rate_limit: reserve the next request slot, then sleep until it comes up"""
+        # Shares the slot reservation with worker-thread callers; the lock is never held across an await
+        with self._rate_lock:
+            current_time = time.time()
+            wait = max(0.0, self.last_request_time + self.min_request_interval - current_time)
+            self.last_request_time = current_time + wait
+        if wait:
+            await asyncio.sleep(wait)
+    
+    def _generate_signature(self, method: str, path: str, body: bytes, timestamp: str) -> str:
         """Generate Ed25519 signature for API authentication"""
-        message = f"{method}|{path}|{body}|{timestamp}"
-        signature = self.private_key.sign(message.encode()).signature
-        return base64.b64encode(signature).decode()
+        message = b"|".join((method.encode(), path.encode(), body, timestamp.encode()))
+        signature = self.private_key.sign(message)
+        return binascii.b2a_base64(signature, newline=False).decode('ascii')
     
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
-        """Make authenticated request to Robinhood API"""
-        self._rate_limit()
+    def _get_signed_timestamp(self, method: str, endpoint: str, body: bytes) -> Tuple[str, str]:
+        """Return (timestamp, signature), reusing a recent signature for repeated bodiless GETs"""
+        now = time.time()
+        if method != "GET" or body:
+            timestamp = str(int(now))
+            return timestamp, self._generate_signature(method, endpoint, body, timestamp)
         
-        url = f"{self.base_url}{endpoint}"
-        timestamp = str(int(datetime.datetime.now().timestamp()))
-        body = json.dumps(data) if data else ""
+        key = (method, endpoint)
+        cached = self._sig_cache.get(key)
+        if cached and now - cached[0] < self.signature_reuse_s:
+            return cached[1], cached[2]
         
+        if len(self._sig_cache) >= 128:
+            self._sig_cache.clear()
+        
+        timestamp = str(int(now))
         signature = self._generate_signature(method, endpoint, body, timestamp)
+        self._sig_cache[key] = (now, timestamp, signature)
+        return timestamp, signature
+    
+    def _build_request(self, method: str, endpoint: str, data: Optional[Dict]) -> Tuple[str, Dict[str, str], bytes]:
+        """Return the URL, signed headers and body for an API request"""
+        url = f"{self.base_url}{endpoint}"
+        body = orjson.dumps(data) if data else b""
+        timestamp, signature = self._get_signed_timestamp(method, endpoint, body)
         
         headers = {
             "x-api-key": self.api_key,
@@ -54,29 +102,62 @@ class RobinhoodClient:
             "x-timestamp": timestamp,
             "Content-Type": "application/json"
         }
+        return url, headers, body
+    
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
+        """Make authenticated request to Robinhood API"""
+        self._rate_limit()
+        
+        url, headers, body = self._build_request(method, endpoint, data)
         
         try:
             if method == "GET":
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self.session.get(url, headers=headers, timeout=30)
             elif method == "POST":
-                response = requests.post(url, headers=headers, data=body, timeout=30)
+                response = self.session.post(url, headers=headers, data=body, timeout=30)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"API request failed: {e}")
-            raise
+            raise RobinhoodAPIError(str(e)) from e
     
-    def get_account(self) -> Dict:
+    async def _make_async_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
+        """Make authenticated request to Robinhood API on the shared async client"""
+        await self._async_rate_limit()
+        
+        url, headers, body = self._build_request(method, endpoint, data)
+        
+        try:
+            if method == "GET":
+                response = await self.http_client.get(url, headers=headers)
+            elif method == "POST":
+                response = await self.http_client.post(url, headers=headers, content=body)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error(f"API request failed: {e}")
+            raise RobinhoodAPIError(str(e)) from e
+    
+    async def aclose(self):
+        """Close the pooled connections of both HTTP clients"""
+        self.session.close()
+        await self.http_client.aclose()
+    
+    async def get_account(self) -> Dict:
         """Get account information"""
-        return self._make_request("GET", "/api/v1/crypto/trading/accounts/")
+        return await self._make_async_request("GET", "/api/v1/crypto/trading/accounts/")
     
-    def get_holdings(self) -> List[Dict]:
+    async def get_holdings(self) -> List[Dict]:
         """Get current crypto holdings"""
-        return self._make_request("GET", "/api/v1/crypto/trading/holdings/")
+        return await self._make_async_request("GET", "/api/v1/crypto/trading/holdings/")
     
     def get_trading_pairs(self) -> List[Dict]:
         """Get available trading pairs"""
@@ -98,21 +179,21 @@ class RobinhoodClient:
         endpoint = f"/api/v1/crypto/trading/estimated_price/?{requests.compat.urlencode(params)}"
         return self._make_request("GET", endpoint)
     
-    def place_order(self, order_data: Dict) -> Dict:
+    async def place_order(self, order_data: Dict) -> Dict:
         """Place a new crypto order"""
-        return self._make_request("POST", "/api/v1/crypto/trading/orders/", order_data)
+        return await self._make_async_request("POST", "/api/v1/crypto/trading/orders/", order_data)
     
-    def get_orders(self, limit: int = 20) -> List[Dict]:
+    async def get_orders(self, limit: int = 20) -> List[Dict]:
         """Get order history"""
         params = {"limit": limit}
         endpoint = f"/api/v1/crypto/trading/orders/?{requests.compat.urlencode(params)}"
-        return self._make_request("GET", endpoint)
+        return await self._make_async_request("GET", endpoint)
     
-    def cancel_order(self, order_id: str) -> Dict:
+    async def cancel_order(self, order_id: str) -> Dict:
         """Cancel an open order"""
-        return self._make_request("POST", f"/api/v1/crypto/trading/orders/{order_id}/cancel/")
+        return await self._make_async_request("POST", f"/api/v1/crypto/trading/orders/{order_id}/cancel/")
     
-    def create_market_order(self, symbol: str, side: str, quote_amount: float) -> Dict:
+    async def create_market_order(self, symbol: str, side: str, quote_amount: float) -> Dict:
         """Create a market order with quote amount (USD)"""
         order_data = {
             "client_order_id": str(uuid.uuid4()),
@@ -123,9 +204,9 @@ class RobinhoodClient:
             },
             "symbol": symbol
         }
-        return self.place_order(order_data)
+        return await self.place_order(order_data)
     
-    def create_limit_order(self, symbol: str, side: str, asset_quantity: float, limit_price: float) -> Dict:
+    async def create_limit_order(self, symbol: str, side: str, asset_quantity: float, limit_price: float) -> Dict:
         """Create a limit order"""
         order_data = {
             "client_order_id": str(uuid.uuid4()),
@@ -138,9 +219,9 @@ class RobinhoodClient:
             },
             "symbol": symbol
         }
-        return self.place_order(order_data)
+        return await self.place_order(order_data)
     
-    def create_stop_loss_order(self, symbol: str, side: str, asset_quantity: float, stop_price: float) -> Dict:
+    async def create_stop_loss_order(self, symbol: str, side: str, asset_quantity: float, stop_price: float) -> Dict:
         """Create a stop loss order"""
         order_data = {
             "client_order_id": str(uuid.uuid4()),
@@ -153,4 +234,4 @@ class RobinhoodClient:
             },
             "symbol": symbol
         }
-        return self.place_order(order_data)
+        return await self.place_order(order_data)
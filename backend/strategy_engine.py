@@ -2,7 +2,12 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 import logging
+import multiprocessing
+import os
+import time
 from technical_indicators import TechnicalIndicators
 from ml_engine import EnsembleMLEngine
 from risk_manager import RiskManager
@@ -10,6 +15,31 @@ from data_manager import DataManager
 
 logger = logging.getLogger(__name__)
 
+
+def _build_symbol_training_set(symbol: str, db_path: str) -> Optional[Tuple[pd.DataFrame, pd.Series]]:
+    """Build aligned (features, labels) for one symbol; runs in a worker process"""
+    data_manager = DataManager(None, db_path)
+    ml_engine = EnsembleMLEngine()
+    
+    historical_data = data_manager.get_historical_data(symbol, period="6mo", interval="1h")
+    
+    if historical_data.empty or len(historical_data) < 100:
+        return None
+    
+    high, low, close, volume = TechnicalIndicators.to_ohlcv_arrays(historical_data)
+    indicators = TechnicalIndicators.calculate_all_indicators(high, low, close, volume)
+    
+    features = ml_engine.prepare_features(historical_data, indicators)
+    
+    labels = ml_engine.create_labels(historical_data['close'])
+    
+    common_index = features.index.intersection(labels.index)
+    if len(common_index) <= 50:
+        return None
+    
+    return features.loc[common_index], labels.loc[common_index]
+
+
 class StrategyEngine:
     """
     Trading Strategy Engine combining technical analysis with ML predictions
@@ -28,7 +58,7 @@ class StrategyEngine:
         self.ml_engine = ml_engine
         self.symbols = symbols
         self.active_signals = {}
-        self.last_analysis_time = {}
+        self.last_analysis_time: Dict[str, float] = {}  # time.monotonic() of the last analysis
         self.min_analysis_interval = 180  # 3 minutes
         
         self.confidence_threshold = 0.55
@@ -41,26 +71,14 @@ class StrategyEngine:
             if self._should_skip_analysis(symbol):
                 return self.active_signals.get(symbol, {})
             
-            historical_data = self.data_manager.get_historical_data(symbol, period="3mo", interval="1h")
-            
-            if historical_data.empty or len(historical_data) < self.lookback_period:
-                logger.warning(f"Insufficient data for {symbol}")
+            prepared = self._prepare_analysis(symbol)
+            if prepared is None:
                 return {}
             
-            indicators = TechnicalIndicators.calculate_all_indicators(
-                historical_data['high'],
-                historical_data['low'],
-                historical_data['close'],
-                historical_data['volume']
-            )
-            
-            technical_signals = TechnicalIndicators.generate_signals(indicators)
-            
-            features = self.ml_engine.prepare_features(historical_data, indicators)
-            
             ml_signal = 1  # Default to hold
             ml_confidence = 0.5
             
+            features = prepared['features']
             if self.ml_engine.is_trained and not features.empty:
                 try:
                     latest_features = features.iloc[-1:].to_dict('records')[0]
@@ -68,31 +86,73 @@ class StrategyEngine:
                 except Exception as e:
                     logger.warning(f"ML prediction failed for {symbol}: {e}")
             
-            analysis_result = self._combine_signals(
-                symbol, 
-                technical_signals.iloc[-1] if not technical_signals.empty else 0,
-                ml_signal,
-                ml_confidence,
-                indicators,
-                historical_data.iloc[-1] if not historical_data.empty else None
-            )
-            
-            self.active_signals[symbol] = analysis_result
-            self.last_analysis_time[symbol] = datetime.now()
-            
-            return analysis_result
+            return self._finalize_analysis(symbol, prepared, ml_signal, ml_confidence)
         
         except Exception as e:
             logger.error(f"Error analyzing market for {symbol}: {e}")
             return {}
     
+    def _prepare_analysis(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch history and compute indicators, technical signal and ML features for a symbol"""
+        historical_data = self.data_manager.get_historical_data(symbol, period="3mo", interval="1h")
+        
+        if historical_data.empty or len(historical_data) < self.lookback_period:
+            logger.warning(f"Insufficient data for {symbol}")
+            return None
+        
+        indicators = TechnicalIndicators.calculate_all_indicators_cached(
+            f"{symbol}:3mo:1h", historical_data
+        )
+        
+        technical_signals = TechnicalIndicators.generate_signals(indicators)
+        
+        features = self.ml_engine.prepare_features(historical_data, indicators)
+        
+        return {
+            'historical_data': historical_data,
+            'indicators': indicators,
+            'technical_signal': int(technical_signals[-1]) if len(technical_signals) else 0,
+            'features': features
+        }
+    
+    def signal_for(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Run the per-symbol stage of signal generation, logging and swallowing errors so it is safe in worker threads
+        
+        The returned analysis is turned into a signal by collect_signals, which batches the ML step across symbols.
+        """
+        try:
+            return self._prepare_analysis(symbol)
+        except Exception as e:
+            logger.error(f"Error analyzing market for {symbol}: {e}")
+            return None
+    
+    def _finalize_analysis(
+        self,
+        symbol: str,
+        prepared: Dict[str, Any],
+        ml_signal: int,
+        ml_confidence: float
+    ) -> Dict[str, Any]:
+        """Combine prepared analysis with the ML prediction and record it as the active signal"""
+        historical_data = prepared['historical_data']
+        
+        analysis_result = self._combine_signals(
+            symbol, 
+            prepared['technical_signal'],
+            ml_signal,
+            ml_confidence,
+            prepared['indicators'],
+            historical_data.iloc[-1] if not historical_data.empty else None
+        )
+        
+        self.active_signals[symbol] = analysis_result
+        self.last_analysis_time[symbol] = time.monotonic()
+        
+        return analysis_result
+    
     def _should_skip_analysis(self, symbol: str) -> bool:
         """Check if analysis should be skipped based on timing"""
-        if symbol not in self.last_analysis_time:
-            return False
-        
-        time_since_last = datetime.now() - self.last_analysis_time[symbol]
-        return time_since_last.total_seconds() < self.min_analysis_interval
+        return time.monotonic() - self.last_analysis_time.get(symbol, float('-inf')) < self.min_analysis_interval
     
     def _combine_signals(
         self, 
@@ -100,11 +160,17 @@ class StrategyEngine:
         technical_signal: int,
         ml_signal: int,
         ml_confidence: float,
-        indicators: Dict[str, pd.Series],
+        indicators: Dict[str, np.ndarray],
         latest_data: Optional[pd.Series]
     ) -> Dict[str, Any]:
         """Combine technical and ML signals into trading decision"""
         
+        tails = {
+            name: float(values[-1])
+            for name, values in indicators.items()
+            if len(values)
+        }
+        
         signal_weights = {
             'technical': 0.3,
             'ml': 0.7
@@ -125,57 +191,92 @@ class StrategyEngine:
             action = 'hold'
             strength = 0.0
         
+        result = {
+            'symbol': symbol,
+            'action': action,
+            'strength': strength,
+            'confidence': ml_confidence,
+            'technical_signal': technical_signal,
+            'ml_signal': ml_signal,
+            'current_price': latest_data['close'] if latest_data is not None else None,
+            'timestamp': datetime.now(),
+            'risk_metrics': {},
+            'indicators': {
+                'rsi': tails.get('rsi'),
+                'macd': tails.get('macd'),
+                'macd_signal': tails.get('signal'),
+                'sma_20': tails.get('sma_20'),
+                'ema_12': tails.get('ema_12')
+            }
+        }
+        
+        # Holds never trade, so skip the live quote and risk sizing for them
+        if action == 'hold':
+            return result
+        
         current_price = self.data_manager.get_latest_price(symbol)
-        if current_price is None and latest_data is not None:
-            current_price = latest_data['close']
+        if current_price is not None:
+            result['current_price'] = current_price
+        current_price = result['current_price']
         
-        atr = indicators['atr'].iloc[-1] if 'atr' in indicators and not indicators['atr'].empty else 0
+        atr = tails.get('atr', 0)
         
-        risk_metrics = {}
         if current_price and atr > 0:
-            if action == 'buy':
-                stop_loss = self.risk_manager.calculate_atr_stop_loss(current_price, atr, 'buy')
-                take_profit = self.risk_manager.calculate_take_profit(current_price, stop_loss, 'buy')
-                position_size = self.risk_manager.calculate_position_size(current_price, stop_loss, atr)
-            elif action == 'sell':
-                stop_loss = self.risk_manager.calculate_atr_stop_loss(current_price, atr, 'sell')
-                take_profit = self.risk_manager.calculate_take_profit(current_price, stop_loss, 'sell')
-                position_size = self.risk_manager.calculate_position_size(current_price, stop_loss, atr)
-            else:
-                stop_loss = take_profit = position_size = 0
+            stop_loss = self.risk_manager.calculate_atr_stop_loss(current_price, atr, action)
+            take_profit = self.risk_manager.calculate_take_profit(current_price, stop_loss, action)
+            position_size = self.risk_manager.calculate_position_size(current_price, stop_loss, atr)
             
-            risk_metrics = {
+            result['risk_metrics'] = {
                 'stop_loss': stop_loss,
                 'take_profit': take_profit,
                 'position_size': position_size,
                 'atr': atr
             }
         
-        return {
-            'symbol': symbol,
-            'action': action,
-            'strength': strength,
-            'confidence': ml_confidence,
-            'technical_signal': technical_signal,
-            'ml_signal': ml_signal,
-            'current_price': current_price,
-            'timestamp': datetime.now(),
-            'risk_metrics': risk_metrics,
-            'indicators': {
-                'rsi': indicators['rsi'].iloc[-1] if 'rsi' in indicators and not indicators['rsi'].empty else None,
-                'macd': indicators['macd'].iloc[-1] if 'macd' in indicators and not indicators['macd'].empty else None,
-                'macd_signal': indicators['signal'].iloc[-1] if 'signal' in indicators and not indicators['signal'].empty else None,
-                'sma_20': indicators['sma_20'].iloc[-1] if 'sma_20' in indicators and not indicators['sma_20'].empty else None,
-                'ema_12': indicators['ema_12'].iloc[-1] if 'ema_12' in indicators and not indicators['ema_12'].empty else None
-            }
-        }
+        return result
     
     def get_trading_signals(self) -> List[Dict[str, Any]]:
         """Get trading signals for all symbols"""
-        signals = []
+        pending = self.pending_symbols()
+        
+        prepared = {}
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                prepared = dict(zip(pending, executor.map(self.signal_for, pending)))
+        
+        return self.collect_signals(prepared)
+    
+    def pending_symbols(self) -> List[str]:
+        """Symbols whose last analysis is older than min_analysis_interval"""
+        return [symbol for symbol in self.symbols if not self._should_skip_analysis(symbol)]
+    
+    def collect_signals(self, prepared: Dict[str, Optional[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Finish the analyses from signal_for with one batched ML call and return the actionable signals
+        
+        Symbols missing from prepared reuse their active signal; a None analysis counts as failed.
+        """
+        analyses = {}
+        ml_results = self._predict_latest(prepared) if prepared else {}
         
         for symbol in self.symbols:
-            signal = self.analyze_market(symbol)
+            if symbol not in prepared:
+                analyses[symbol] = self.active_signals.get(symbol, {})
+                continue
+            
+            if prepared[symbol] is None:
+                analyses[symbol] = {}
+                continue
+            
+            ml_signal, ml_confidence = ml_results.get(symbol, (1, 0.5))
+            try:
+                analyses[symbol] = self._finalize_analysis(symbol, prepared[symbol], ml_signal, ml_confidence)
+            except Exception as e:
+                logger.error(f"Error analyzing market for {symbol}: {e}")
+                analyses[symbol] = {}
+        
+        signals = []
+        for symbol in self.symbols:
+            signal = analyses.get(symbol)
             if signal and signal.get('action') != 'hold' and signal.get('strength', 0) >= self.signal_strength_threshold:
                 signals.append(signal)
         
@@ -183,6 +284,30 @@ class StrategyEngine:
         
         return signals
     
+    def _predict_latest(self, prepared: Dict[str, Optional[Dict[str, Any]]]) -> Dict[str, Tuple[int, float]]:
+        """Predict on every symbol's latest feature row with a single batched model call"""
+        if not self.ml_engine.is_trained:
+            return {}
+        
+        rows = [
+            (symbol, analysis['features'].iloc[-1:])
+            for symbol, analysis in prepared.items()
+            if analysis is not None and not analysis['features'].empty
+        ]
+        if not rows:
+            return {}
+        
+        try:
+            predictions, confidences = self.ml_engine.predict_batch(pd.concat([row for _, row in rows]))
+        except Exception as e:
+            logger.warning(f"Batched ML prediction failed: {e}")
+            return {}
+        
+        return {
+            symbol: (prediction, confidence)
+            for (symbol, _), prediction, confidence in zip(rows, predictions, confidences)
+        }
+    
     def should_execute_trade(self, signal: Dict[str, Any]) -> Tuple[bool, str]:
         """Determine if a trade should be executed based on signal and risk management"""
         if not signal or signal.get('action') == 'hold':
@@ -218,27 +343,22 @@ class StrategyEngine:
             all_features = []
             all_labels = []
             
-            for symbol in self.symbols:
-                historical_data = self.data_manager.get_historical_data(symbol, period="6mo", interval="1h")
-                
-                if historical_data.empty or len(historical_data) < 100:
-                    continue
-                
-                indicators = TechnicalIndicators.calculate_all_indicators(
-                    historical_data['high'],
-                    historical_data['low'],
-                    historical_data['close'],
-                    historical_data['volume']
+            max_workers = max(1, min(len(self.symbols), os.cpu_count() or 1))
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                results = executor.map(
+                    _build_symbol_training_set,
+                    self.symbols,
+                    repeat(self.data_manager.db_path)
                 )
                 
-                features = self.ml_engine.prepare_features(historical_data, indicators)
-                
-                labels = self.ml_engine.create_labels(historical_data['close'])
-                
-                common_index = features.index.intersection(labels.index)
-                if len(common_index) > 50:
-                    all_features.append(features.loc[common_index])
-                    all_labels.append(labels.loc[common_index])
+                for result in results:
+                    if result is not None:
+                        features, labels = result
+                        all_features.append(features)
+                        all_labels.append(labels)
             
             if not all_features:
                 return {'status': 'failed', 'reason': 'No training data available'}
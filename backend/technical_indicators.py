@@ -1,7 +1,96 @@
 import pandas as pd
 import numpy as np
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import talib
+from _jit import NUMBA_AVAILABLE, njit
+
+
+@njit("int8[:](float64[:], float64[:], float64[:], float64[:], float64[:])", cache=True)
+def _generate_signals_kernel(rsi, macd, macd_signal, ema_12, ema_26):
+    """Single-pass buy (1) / sell (-1) / hold (0) classification per bar"""
+    n = rsi.shape[0]
+    signals = np.zeros(n, dtype=np.int8)
+    for i in range(1, n):
+        buy = (
+            rsi[i] < 30
+            and macd[i] > macd_signal[i] and macd[i - 1] <= macd_signal[i - 1]
+            and ema_12[i] > ema_26[i]
+        )
+        sell = (
+            rsi[i] > 70
+            and macd[i] < macd_signal[i] and macd[i - 1] >= macd_signal[i - 1]
+            and ema_12[i] < ema_26[i]
+        )
+        signals[i] = int(buy) - int(sell)
+    return signals
+
+
+@lru_cache(maxsize=8)
+def _make_fused_trend_kernel(fast: int, slow: int, signal_period: int, sma_period: int):
+    """Compile the fused trend pass with its periods baked in as compile-time constants"""
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    alpha_signal = 2.0 / (signal_period + 1)
+    signal_start = slow - 1 + signal_period - 1
+    
+    # An explicit signature compiles eagerly here rather than on the first call
+    @njit("UniTuple(float64[:], 6)(float64[:])")
+    def fused_trend_kernel(close):
+        """One sweep over close producing EMA(fast), EMA(slow), MACD, its signal EMA, histogram and SMA"""
+        n = close.shape[0]
+        ema_fast = np.full(n, np.nan)
+        ema_slow = np.full(n, np.nan)
+        macd = np.full(n, np.nan)
+        macd_signal = np.full(n, np.nan)
+        macd_hist = np.full(n, np.nan)
+        sma = np.full(n, np.nan)
+        
+        fast_sum = 0.0
+        slow_sum = 0.0
+        signal_sum = 0.0
+        window_sum = 0.0
+        for i in range(n):
+            x = close[i]
+            
+            # EMAs are seeded with the SMA of their first period, matching talib
+            if i < fast:
+                fast_sum += x
+                if i == fast - 1:
+                    ema_fast[i] = fast_sum / fast
+            else:
+                ema_fast[i] = ema_fast[i - 1] + alpha_fast * (x - ema_fast[i - 1])
+            
+            if i < slow:
+                slow_sum += x
+                if i == slow - 1:
+                    ema_slow[i] = slow_sum / slow
+            else:
+                ema_slow[i] = ema_slow[i - 1] + alpha_slow * (x - ema_slow[i - 1])
+            
+            if i >= slow - 1:
+                m = ema_fast[i] - ema_slow[i]
+                macd[i] = m
+                if i < signal_start:
+                    signal_sum += m
+                elif i == signal_start:
+                    signal_sum += m
+                    macd_signal[i] = signal_sum / signal_period
+                else:
+                    macd_signal[i] = macd_signal[i - 1] + alpha_signal * (m - macd_signal[i - 1])
+                macd_hist[i] = m - macd_signal[i]
+            
+            window_sum += x
+            if i >= sma_period:
+                window_sum -= close[i - sma_period]
+            if i >= sma_period - 1:
+                sma[i] = window_sum / sma_period
+        
+        return ema_fast, ema_slow, macd, macd_signal, macd_hist, sma
+    
+    return fused_trend_kernel
+
 
 class TechnicalIndicators:
     """
@@ -9,83 +98,112 @@ class TechnicalIndicators:
     Includes RSI, MACD, Moving Averages, Bollinger Bands, ADX, and OBV
     """
     
+    _incremental_state: Dict[str, 'IncrementalIndicators'] = {}
+    
     @staticmethod
-    def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
+    def calculate_rsi(prices: np.ndarray, period: int = 14) -> np.ndarray:
         """Calculate Relative Strength Index"""
-        return pd.Series(talib.RSI(prices.values, timeperiod=period), index=prices.index)
+        return talib.RSI(prices, timeperiod=period)
     
     @staticmethod
-    def calculate_macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, pd.Series]:
+    def calculate_macd(prices: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
         """Calculate MACD indicator"""
         macd, macd_signal, macd_histogram = talib.MACD(
-            prices.values, 
+            prices, 
             fastperiod=fast, 
             slowperiod=slow, 
             signalperiod=signal
         )
         
         return {
-            'macd': pd.Series(macd, index=prices.index),
-            'signal': pd.Series(macd_signal, index=prices.index),
-            'histogram': pd.Series(macd_histogram, index=prices.index)
+            'macd': macd,
+            'signal': macd_signal,
+            'histogram': macd_histogram
         }
     
     @staticmethod
-    def calculate_moving_averages(prices: pd.Series, periods: List[int] = [20, 50]) -> Dict[str, pd.Series]:
+    def calculate_moving_averages(prices: np.ndarray, periods: List[int] = [20, 50]) -> Dict[str, np.ndarray]:
         """Calculate Simple and Exponential Moving Averages"""
         mas = {}
         for period in periods:
-            mas[f'sma_{period}'] = pd.Series(talib.SMA(prices.values, timeperiod=period), index=prices.index)
-            mas[f'ema_{period}'] = pd.Series(talib.EMA(prices.values, timeperiod=period), index=prices.index)
+            mas[f'sma_{period}'] = talib.SMA(prices, timeperiod=period)
+            mas[f'ema_{period}'] = talib.EMA(prices, timeperiod=period)
         return mas
     
     @staticmethod
-    def calculate_bollinger_bands(prices: pd.Series, period: int = 20, std_dev: int = 2) -> Dict[str, pd.Series]:
+    def calculate_fused_trend(prices: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9, sma_period: int = 20) -> Dict[str, np.ndarray]:
+        """Calculate EMA12/EMA26, MACD (line, signal, histogram) and SMA20 in a single pass"""
+        kernel = _make_fused_trend_kernel(fast, slow, signal, sma_period)
+        ema_fast, ema_slow, macd, macd_signal, macd_hist, sma = kernel(
+            np.ascontiguousarray(prices, dtype=np.float64)
+        )
+        
+        return {
+            f'ema_{fast}': ema_fast,
+            f'ema_{slow}': ema_slow,
+            'macd': macd,
+            'signal': macd_signal,
+            'histogram': macd_hist,
+            f'sma_{sma_period}': sma
+        }
+    
+    @staticmethod
+    def calculate_bollinger_bands(prices: np.ndarray, period: int = 20, std_dev: int = 2) -> Dict[str, np.ndarray]:
         """Calculate Bollinger Bands"""
         upper, middle, lower = talib.BBANDS(
-            prices.values, 
+            prices, 
             timeperiod=period, 
             nbdevup=std_dev, 
             nbdevdn=std_dev
         )
         
         return {
-            'bb_upper': pd.Series(upper, index=prices.index),
-            'bb_middle': pd.Series(middle, index=prices.index),
-            'bb_lower': pd.Series(lower, index=prices.index)
+            'bb_upper': upper,
+            'bb_middle': middle,
+            'bb_lower': lower
         }
     
     @staticmethod
-    def calculate_adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+    def calculate_adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
         """Calculate Average Directional Index"""
-        return pd.Series(talib.ADX(high.values, low.values, close.values, timeperiod=period), index=close.index)
+        return talib.ADX(high, low, close, timeperiod=period)
     
     @staticmethod
-    def calculate_obv(close: pd.Series, volume: pd.Series) -> pd.Series:
+    def calculate_obv(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
         """Calculate On-Balance Volume"""
-        return pd.Series(talib.OBV(close.values, volume.values), index=close.index)
+        return talib.OBV(close, volume)
     
     @staticmethod
-    def calculate_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+    def calculate_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
         """Calculate Average True Range for volatility measurement"""
-        return pd.Series(talib.ATR(high.values, low.values, close.values, timeperiod=period), index=close.index)
+        return talib.ATR(high, low, close, timeperiod=period)
+    
+    @staticmethod
+    def to_ohlcv_arrays(data: pd.DataFrame) -> np.ndarray:
+        """Copy high/low/close/volume into one contiguous float64 block, one row per column"""
+        # Always copy: to_numpy may hand back a read-only view of the frame's block
+        return np.array(
+            data[['high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64).T, order='C'
+        )
     
     @staticmethod
     def calculate_all_indicators(
-        high: pd.Series, 
-        low: pd.Series, 
-        close: pd.Series, 
-        volume: pd.Series
-    ) -> Dict[str, pd.Series]:
+        high: np.ndarray, 
+        low: np.ndarray, 
+        close: np.ndarray, 
+        volume: np.ndarray
+    ) -> Dict[str, np.ndarray]:
         """Calculate all technical indicators for a complete feature set"""
         indicators = {}
         
         indicators['rsi'] = TechnicalIndicators.calculate_rsi(close)
         
-        macd_data = TechnicalIndicators.calculate_macd(close)
-        indicators.update(macd_data)
+        trend_data = TechnicalIndicators.calculate_fused_trend(close)
+        indicators.update(trend_data)
+        
+        indicators['ema_20'] = talib.EMA(close, timeperiod=20)
         
-        ma_data = TechnicalIndicators.calculate_moving_averages(close)
+        ma_data = TechnicalIndicators.calculate_moving_averages(close, periods=[50])
         indicators.update(ma_data)
         
         bb_data = TechnicalIndicators.calculate_bollinger_bands(close)
@@ -99,24 +217,147 @@ class TechnicalIndicators:
         
         return indicators
     
+    @classmethod
+    def calculate_all_indicators_cached(cls, cache_key: str, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Calculate all indicators, extending the previous result for cache_key when only new bars arrived"""
+        state = cls._incremental_state.get(cache_key)
+        if state is None:
+            state = cls._incremental_state.setdefault(cache_key, IncrementalIndicators(cache_key))
+        return state.update(data)
+    
     @staticmethod
-    def generate_signals(indicators: Dict[str, pd.Series]) -> pd.Series:
+    def generate_signals(indicators: Dict[str, np.ndarray]) -> np.ndarray:
         """Generate trading signals based on technical indicators"""
-        signals = pd.Series(0, index=indicators['rsi'].index)
+        if not NUMBA_AVAILABLE:
+            return TechnicalIndicators._generate_signals_vectorized(indicators)
         
-        rsi_oversold = indicators['rsi'] < 30
-        rsi_overbought = indicators['rsi'] > 70
+        return _generate_signals_kernel(
+            np.ascontiguousarray(indicators['rsi'], dtype=np.float64),
+            np.ascontiguousarray(indicators['macd'], dtype=np.float64),
+            np.ascontiguousarray(indicators['signal'], dtype=np.float64),
+            np.ascontiguousarray(indicators['ema_12'], dtype=np.float64),
+            np.ascontiguousarray(indicators['ema_26'], dtype=np.float64)
+        )
+    
+    @staticmethod
+    def _generate_signals_vectorized(indicators: Dict[str, np.ndarray]) -> np.ndarray:
+        """NumPy equivalent of _generate_signals_kernel for when numba is unavailable"""
+        rsi = indicators['rsi']
+        spread = indicators['macd'] - indicators['signal']
         
-        macd_bullish = (indicators['macd'] > indicators['signal']) & (indicators['macd'].shift(1) <= indicators['signal'].shift(1))
-        macd_bearish = (indicators['macd'] < indicators['signal']) & (indicators['macd'].shift(1) >= indicators['signal'].shift(1))
+        # Crossovers compare each bar with the previous one through offset views of a single spread array
+        macd_bullish = np.zeros(len(spread), dtype=bool)
+        macd_bullish[1:] = (spread[1:] > 0) & (spread[:-1] <= 0)
+        macd_bearish = np.zeros(len(spread), dtype=bool)
+        macd_bearish[1:] = (spread[1:] < 0) & (spread[:-1] >= 0)
         
-        ma_bullish = indicators['ema_12'] > indicators['ema_26']
-        ma_bearish = indicators['ema_12'] < indicators['ema_26']
+        ma_spread = indicators['ema_12'] - indicators['ema_26']
         
-        buy_signals = rsi_oversold & macd_bullish & ma_bullish
-        sell_signals = rsi_overbought & macd_bearish & ma_bearish
+        buy_signals = (rsi < 30) & macd_bullish & (ma_spread > 0)
+        sell_signals = (rsi > 70) & macd_bearish & (ma_spread < 0)
         
+        signals = np.zeros(len(rsi), dtype=np.int8)
         signals[buy_signals] = 1
         signals[sell_signals] = -1
         
         return signals
+
+
+class IncrementalIndicators:
+    """
+    Indicator state for one price series (symbol/period/interval)
+    Appends values for newly arrived bars instead of recomputing the full history
+    Safe to share between worker threads and the event loop thread
+    """
+    
+    max_new_bars = 5
+    # Tail length for RSI/ADX: Wilder smoothing seeded this far back agrees with the full history to ~1e-8
+    stream_window = 250
+    
+    def __init__(self, key: str):
+        self.key = key
+        self._index: Optional[pd.Index] = None
+        self._last_close = np.nan
+        self._indicators: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+    
+    def update(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Return indicators for data, computing only the bars appended since the last call"""
+        ohlcv = TechnicalIndicators.to_ohlcv_arrays(data)
+        
+        with self._lock:
+            alignment = self._align(data.index, ohlcv[2])
+            if alignment is None:
+                self._indicators = TechnicalIndicators.calculate_all_indicators(*ohlcv)
+            else:
+                dropped, first_new = alignment
+                if dropped or first_new < len(data.index):
+                    indicators = {name: values[dropped:] for name, values in self._indicators.items()}
+                    if dropped:
+                        # OBV is a running sum from the first bar, so rebase it on the new head as a full recompute would
+                        indicators['obv'] = indicators['obv'] + (ohlcv[3][0] - indicators['obv'][0])
+                    self._indicators = self._stream(ohlcv, indicators, first_new)
+            
+            self._index = data.index
+            self._last_close = ohlcv[2][-1]
+            return self._indicators
+    
+    def _align(self, index: pd.Index, close: np.ndarray) -> Optional[Tuple[int, int]]:
+        """Return (bars dropped from the head, position of the first new bar) if the cached state still applies"""
+        if self._index is None or not self._indicators or len(index) < self.stream_window:
+            return None
+        if any(len(values) != len(self._index) for values in self._indicators.values()):
+            return None
+        
+        position = index.get_indexer(self._index[-1:])[0]
+        if position < 0 or close[position] != self._last_close:
+            return None
+        
+        new_bars = len(index) - 1 - position
+        dropped = len(self._index) - 1 - position
+        if new_bars > self.max_new_bars or dropped < 0:
+            return None
+        
+        if not index[:position + 1].equals(self._index[dropped:]):
+            return None
+        
+        return dropped, position + 1
+    
+    def _stream(self, ohlcv: np.ndarray, indicators: Dict[str, np.ndarray], first_new: int) -> Dict[str, np.ndarray]:
+        """Append one value per new bar to every indicator series"""
+        high, low, close, volume = ohlcv
+        last = {name: values[-1] for name, values in indicators.items()}
+        appended = {name: [] for name in indicators}
+        
+        for i in range(first_new, close.shape[0]):
+            start = max(0, i + 1 - self.stream_window)
+            h, l, c = high[start:i + 1], low[start:i + 1], close[start:i + 1]
+            prev_close = close[i - 1]
+            
+            value = {}
+            value['rsi'] = talib.RSI(c, timeperiod=14)[-1]
+            for period in (12, 20, 26, 50):
+                name = f'ema_{period}'
+                value[name] = last[name] + 2.0 / (period + 1) * (close[i] - last[name])
+            value['macd'] = value['ema_12'] - value['ema_26']
+            value['signal'] = last['signal'] + 2.0 / (9 + 1) * (value['macd'] - last['signal'])
+            value['histogram'] = value['macd'] - value['signal']
+            value['sma_20'] = c[-20:].mean()
+            value['sma_50'] = c[-50:].mean()
+            band = 2 * c[-20:].std()
+            value['bb_middle'] = value['sma_20']
+            value['bb_upper'] = value['sma_20'] + band
+            value['bb_lower'] = value['sma_20'] - band
+            value['adx'] = talib.ADX(h, l, c, timeperiod=14)[-1]
+            value['obv'] = last['obv'] + np.sign(close[i] - prev_close) * volume[i]
+            true_range = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+            value['atr'] = (last['atr'] * 13 + true_range) / 14
+            
+            for name in appended:
+                appended[name].append(value[name])
+            last = value
+        
+        return {
+            name: np.concatenate((values, np.asarray(appended[name], dtype=np.float64)))
+            for name, values in indicators.items()
+        }
@@ -1,16 +1,69 @@
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import time
+import numpy as np
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import json
-from robinhood_client import RobinhoodClient
+from robinhood_client import RobinhoodAPIError, RobinhoodClient
 from data_manager import DataManager
 from risk_manager import RiskManager
 from ml_engine import EnsembleMLEngine
 from strategy_engine import StrategyEngine
+from technical_indicators import TechnicalIndicators
+from _jit import njit
 
 logger = logging.getLogger(__name__)
 
+# action -> (order side, protective stop side)
+_SIDE_TABLE = {'buy': ('buy', 'sell'), 'sell': ('sell', 'buy')}
+
+
+@dataclass(slots=True)
+class TradeRecord:
+    """A trade placed by the bot, as kept in trade_history"""
+    timestamp: datetime
+    symbol: str
+    side: str
+    quantity: float
+    price: float
+    quote_amount: float
+    order_id: Optional[str]
+    signal_strength: float = 0.0
+    confidence: float = 0.0
+    type: str = 'auto'  # 'auto' for signal-driven trades, 'manual' for manual_trade
+
+
+@njit(
+    "UniTuple(float64[:], 2)(float64[:], float64[:], float64[:], float64[:], boolean[:], "
+    "float64[:], float64[:], float64[:], float64, int64)",
+    cache=True
+)
+def _update_all(prev_atrs, highs, lows, prev_closes, advanced, prev_stops, prices, directions, multiplier, period):
+    """Advance each position's Wilder ATR by its newest bar and ratchet its ATR trailing stop"""
+    n = prev_atrs.shape[0]
+    new_atrs = np.empty(n)
+    new_stops = np.empty(n)
+    for i in range(n):
+        atr = prev_atrs[i]
+        if advanced[i]:
+            true_range = max(
+                highs[i] - lows[i], abs(highs[i] - prev_closes[i]), abs(lows[i] - prev_closes[i])
+            )
+            atr = (atr * (period - 1) + true_range) / period
+        new_atrs[i] = atr
+        
+        # directions is +1 for longs (stop trails below, only moves up) and -1 for shorts
+        candidate = prices[i] - directions[i] * atr * multiplier
+        stop = prev_stops[i]
+        if np.isnan(stop) or (candidate - stop) * directions[i] > 0:
+            stop = candidate
+        new_stops[i] = stop
+    return new_atrs, new_stops
+
 class TradingBot:
     """
     Main Trading Bot class that orchestrates all components
@@ -36,8 +89,16 @@ class TradingBot:
         )
         
         self.is_running = False
-        self.last_trade_time = {}
-        self.trade_history = []
+        # action -> coroutine submitting that action's order for (symbol, quote_amount)
+        self._trade_handlers: Dict[str, Callable[[str, float], Awaitable[Dict]]] = {
+            'buy': self._do_buy,
+            'sell': self._do_sell
+        }
+        self.max_trade_history = 10_000
+        self.last_trade_time: Dict[str, float] = {}  # time.monotonic() of each symbol's last trade
+        self.last_trade_time_wall: Dict[str, datetime] = {}
+        self._symbol_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.trade_history = deque(maxlen=self.max_trade_history)
         self.performance_metrics = {
             'total_trades': 0,
             'winning_trades': 0,
@@ -49,6 +110,21 @@ class TradingBot:
         self.min_trade_interval = 180  # 3 minutes between trades for same symbol
         self.max_trades_per_day = 15
         self.auto_train_interval = 12  # hours
+        self._last_train_ts = float('-inf')  # time.monotonic() of the last successful training
+        
+        self.atr_period = 14
+        # Trailing-stop state as parallel arrays indexed by an integer id per symbol (NaN = no state yet)
+        self._sym_id: Dict[str, int] = {}
+        self._id_sym: List[str] = []
+        self._atr = np.full(16, np.nan)
+        self._prev_close = np.full(16, np.nan)
+        self._trailing_stop = np.full(16, np.nan)
+        self._bar_time: List[Optional[str]] = []
+        self.trailing_stop_concurrency = 10
+        self.cancel_concurrency = 8
+        self.pipeline_concurrency = 8
+        self.account_cache_ttl = 60  # seconds
+        self._account_cache: Optional[tuple] = None
         
     async def start(self) -> Dict[str, Any]:
         """Start the trading bot"""
@@ -65,7 +141,9 @@ class TradingBot:
             
             if not self.ml_engine.is_trained:
                 training_result = self.strategy_engine.train_ml_model()
-                logger.info(f"Initial model training: {training_result}")
+                logger.info("Initial model training: %s", training_result)
+                if training_result.get('status') == 'success':
+                    self._last_train_ts = time.monotonic()
             
             self.is_running = True
             logger.info("Trading bot started successfully")
@@ -78,7 +156,7 @@ class TradingBot:
             }
         
         except Exception as e:
-            logger.error(f"Failed to start trading bot: {e}")
+            logger.error("Failed to start trading bot: %s", e)
             return {'status': 'error', 'message': str(e)}
     
     async def stop(self) -> Dict[str, Any]:
@@ -93,16 +171,23 @@ class TradingBot:
             return {'status': 'success', 'message': 'Trading bot stopped'}
         
         except Exception as e:
-            logger.error(f"Error stopping trading bot: {e}")
+            logger.error("Error stopping trading bot: %s", e)
             return {'status': 'error', 'message': str(e)}
     
     async def _validate_connection(self) -> Optional[Dict]:
-        """Validate connection to Robinhood API"""
+        """Validate connection to Robinhood API, reusing a recent account response"""
+        if self._account_cache is not None:
+            cached_at, account_info = self._account_cache
+            if time.monotonic() - cached_at < self.account_cache_ttl:
+                return account_info
+        
         try:
-            account_info = self.robinhood_client.get_account()
+            account_info = await self.robinhood_client.get_account()
+            if account_info:
+                self._account_cache = (time.monotonic(), account_info)
             return account_info
         except Exception as e:
-            logger.error(f"API connection validation failed: {e}")
+            logger.error("API connection validation failed: %s", e)
             return None
     
     async def execute_trading_cycle(self) -> Dict[str, Any]:
@@ -111,27 +196,41 @@ class TradingBot:
             return {'status': 'stopped', 'message': 'Bot is not running'}
         
         try:
-            self.data_manager.update_real_time_data(self.strategy_engine.symbols)
+            signals = await self._run_signal_pipeline()
+            
+            # Bind hot attributes to locals once for the per-signal loops below
+            should_execute_trade = self.strategy_engine.should_execute_trade
+            execute_trade_locked = self._execute_trade_locked
+            
+            candidates = [
+                signal for signal in self._vectorized_prefilter(signals)
+                if should_execute_trade(signal)[0]
+            ]
             
-            signals = self.strategy_engine.get_trading_signals()
+            # Trades in different symbols are independent, so submit them all at once. gather (not a
+            # TaskGroup) so one failing trade never cancels sibling orders that may already be on the wire
+            results = await asyncio.gather(
+                *(execute_trade_locked(signal) for signal in candidates), return_exceptions=True
+            )
             
             executed_trades = []
+            for signal, trade_result in zip(candidates, results):
+                if isinstance(trade_result, Exception):
+                    logger.error("Trade for %s failed: %s", signal['symbol'], trade_result)
+                elif trade_result['status'] == 'success':
+                    executed_trades.append(trade_result)
             
-            for signal in signals:
-                should_execute, reason = self.strategy_engine.should_execute_trade(signal)
-                
-                if should_execute:
-                    if self._can_trade_symbol(signal['symbol']):
-                        trade_result = await self._execute_trade(signal)
-                        if trade_result['status'] == 'success':
-                            executed_trades.append(trade_result)
-                            self.last_trade_time[signal['symbol']] = datetime.now()
-                
             await self._update_trailing_stops()
             
-            if self.ml_engine.should_retrain(self.auto_train_interval):
+            # Cheap monotonic check first; should_retrain only runs once the interval may have elapsed
+            if (
+                time.monotonic() - self._last_train_ts >= self.auto_train_interval * 3600
+                and self.ml_engine.should_retrain(self.auto_train_interval)
+            ):
                 training_result = self.strategy_engine.train_ml_model()
-                logger.info(f"Auto-retraining result: {training_result}")
+                logger.info("Auto-retraining result: %s", training_result)
+                if training_result.get('status') == 'success':
+                    self._last_train_ts = time.monotonic()
             
             return {
                 'status': 'success',
@@ -141,122 +240,327 @@ class TradingBot:
             }
         
         except Exception as e:
-            logger.error(f"Error in trading cycle: {e}")
+            logger.error("Error in trading cycle: %s", e)
             return {'status': 'error', 'message': str(e)}
     
+    async def _execute_trade_locked(self, signal: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a trade while holding its symbol's lock, so one symbol never has two orders in flight"""
+        symbol = signal['symbol']
+        async with self._symbol_locks[symbol]:
+            if not self._can_trade_symbol(symbol) or symbol in self.risk_manager.open_positions:
+                return {'status': 'skipped', 'reason': f'Already traded {symbol} recently'}
+            
+            return await self._execute_trade(signal)
+    
+    async def _run_signal_pipeline(self) -> List[Dict[str, Any]]:
+        """Refresh prices in one batched request, run the per-symbol analysis concurrently, then batch the ML step"""
+        symbols = list(self.strategy_engine.symbols)
+        await asyncio.to_thread(self.data_manager.update_real_time_data, symbols)
+        
+        pending = self.strategy_engine.pending_symbols()
+        semaphore = asyncio.Semaphore(self.pipeline_concurrency)
+        
+        async def analyze(symbol: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self.strategy_engine.signal_for, symbol)
+        
+        results = await asyncio.gather(*(analyze(symbol) for symbol in pending), return_exceptions=True)
+        
+        prepared = {}
+        for symbol, result in zip(pending, results):
+            if isinstance(result, Exception):
+                logger.error("Error in signal pipeline for %s: %s", symbol, result)
+                result = None
+            prepared[symbol] = result
+        
+        return self.strategy_engine.collect_signals(prepared)
+    
+    def _vectorized_prefilter(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop signals whose trade is below the minimum amount or whose symbol traded too recently"""
+        if not signals:
+            return []
+        
+        count = len(signals)
+        last_trade_time = self.last_trade_time.get
+        position_sizes = np.fromiter(
+            (s.get('risk_metrics', {}).get('position_size', 0) for s in signals), dtype=np.float64, count=count
+        )
+        prices = np.fromiter(
+            (s.get('current_price') or 0 for s in signals), dtype=np.float64, count=count
+        )
+        last_trades = np.fromiter(
+            (last_trade_time(s['symbol'], -np.inf) for s in signals), dtype=np.float64, count=count
+        )
+        
+        eligible = (position_sizes * prices >= 5.0) & (time.monotonic() - last_trades >= self.min_trade_interval)
+        
+        return [signals[i] for i in np.flatnonzero(eligible)]
+    
     def _can_trade_symbol(self, symbol: str) -> bool:
         """Check if we can trade a symbol based on timing constraints"""
-        if symbol not in self.last_trade_time:
-            return True
+        return time.monotonic() - self.last_trade_time.get(symbol, float('-inf')) >= self.min_trade_interval
+    
+    def _validate_signal(self, signal: Dict[str, Any]) -> Tuple[bool, str]:
+        """Check that a signal carries a known action and a tradeable amount"""
+        if signal.get('action') not in self._trade_handlers:
+            return False, f"Unsupported action: {signal.get('action')}"
+        
+        position_size = signal.get('risk_metrics', {}).get('position_size', 0)
+        if position_size * (signal.get('current_price') or 0) < 5.0:
+            return False, 'Trade amount too small'
         
-        time_since_last = datetime.now() - self.last_trade_time[symbol]
-        return time_since_last.total_seconds() >= self.min_trade_interval
+        return True, 'Signal validated'
     
     async def _execute_trade(self, signal: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a trade based on signal"""
+        is_valid, reason = self._validate_signal(signal)
+        if not is_valid:
+            return {'status': 'skipped', 'reason': reason}
+        
+        symbol = signal['symbol']
+        risk_metrics = signal['risk_metrics']
+        current_price = signal['current_price']
+        position_size = risk_metrics['position_size']
+        quote_amount = position_size * current_price
+        action = signal['action']
+        side, stop_side = _SIDE_TABLE[action]
+        
         try:
-            symbol = signal['symbol']
-            action = signal['action']
-            risk_metrics = signal.get('risk_metrics', {})
-            current_price = signal.get('current_price', 0)
-            
-            position_size = risk_metrics.get('position_size', 0)
-            quote_amount = position_size * current_price
-            
-            if quote_amount < 5.0:
-                return {'status': 'skipped', 'reason': 'Trade amount too small'}
-            
-            side = 'buy' if action == 'buy' else 'sell'
-            order_result = self.robinhood_client.create_market_order(symbol, side, quote_amount)
-            
-            trade_record = {
-                'timestamp': datetime.now(),
-                'symbol': symbol,
-                'side': side,
-                'quantity': position_size,
-                'price': current_price,
-                'quote_amount': quote_amount,
-                'order_id': order_result.get('id'),
-                'signal_strength': signal.get('strength', 0),
-                'confidence': signal.get('confidence', 0)
-            }
+            order_result = await self._trade_handlers[action](symbol, quote_amount)
+        except RobinhoodAPIError as e:
+            logger.error("Trade execution failed: %s", e)
+            return {'status': 'error', 'message': str(e)}
+        
+        # The order is filled: stamp the trade time before any bookkeeping that could fail,
+        # so the next cycle cannot submit a duplicate order
+        self.last_trade_time[symbol] = time.monotonic()
+        self.last_trade_time_wall[symbol] = datetime.now()
+        
+        stop_task = None
+        stop_loss_price = risk_metrics.get('stop_loss')
+        if stop_loss_price:
+            stop_task = asyncio.create_task(self.robinhood_client.create_stop_loss_order(
+                symbol, stop_side, position_size, stop_loss_price
+            ))
+        
+        try:
+            trade_record = TradeRecord(
+                timestamp=datetime.now(),
+                symbol=symbol,
+                side=side,
+                quantity=position_size,
+                price=current_price,
+                quote_amount=quote_amount,
+                order_id=order_result.get('id'),
+                signal_strength=signal.get('strength', 0),
+                confidence=signal.get('confidence', 0)
+            )
             
             self.trade_history.append(trade_record)
             self.risk_manager.record_trade(symbol, side, position_size, current_price, "open")
-            
-            stop_loss_price = risk_metrics.get('stop_loss')
-            if stop_loss_price:
+            self.performance_metrics['total_trades'] += 1
+        
+        finally:
+            # Never leave the stop-loss submission orphaned, whichever way the bookkeeping went
+            if stop_task is not None:
                 try:
-                    stop_side = 'sell' if side == 'buy' else 'buy'
-                    self.robinhood_client.create_stop_loss_order(
-                        symbol, stop_side, position_size, stop_loss_price
-                    )
+                    await stop_task
                 except Exception as e:
-                    logger.warning(f"Failed to place stop loss: {e}")
-            
-            logger.info(f"Trade executed: {symbol} {side} {position_size} @ {current_price}")
-            
-            return {
-                'status': 'success',
-                'trade': trade_record,
-                'order_result': order_result
-            }
+                    logger.warning("Failed to place stop loss: %s", e)
         
-        except Exception as e:
-            logger.error(f"Trade execution failed: {e}")
-            return {'status': 'error', 'message': str(e)}
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Trade executed: %s %s %s @ %s", symbol, side, position_size, current_price)
+        
+        return {
+            'status': 'success',
+            'trade': trade_record,
+            'order_result': order_result
+        }
+    
+    async def _do_buy(self, symbol: str, quote_amount: float) -> Dict:
+        """Submit a market buy for quote_amount USD of symbol"""
+        return await self.robinhood_client.create_market_order(symbol, 'buy', quote_amount)
+    
+    async def _do_sell(self, symbol: str, quote_amount: float) -> Dict:
+        """Submit a market sell for quote_amount USD of symbol"""
+        return await self.robinhood_client.create_market_order(symbol, 'sell', quote_amount)
+    
+    def _id(self, symbol: str) -> int:
+        """Integer id of a symbol's slot in the trailing-stop state arrays, assigning one on first use"""
+        symbol_id = self._sym_id.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self._id_sym)
+            if symbol_id == len(self._atr):
+                padding = np.full(len(self._atr), np.nan)
+                self._atr = np.concatenate((self._atr, padding))
+                self._prev_close = np.concatenate((self._prev_close, padding))
+                self._trailing_stop = np.concatenate((self._trailing_stop, padding))
+            self._sym_id[symbol] = symbol_id
+            self._id_sym.append(symbol)
+            self._bar_time.append(None)
+        return symbol_id
     
     async def _update_trailing_stops(self):
         """Update trailing stops for open positions"""
         try:
-            for symbol in self.risk_manager.open_positions:
-                current_price = self.data_manager.get_latest_price(symbol)
-                if current_price:
-                    historical_data = self.data_manager.get_historical_data(symbol, period="1mo")
-                    if not historical_data.empty:
-                        from technical_indicators import TechnicalIndicators
-                        atr = TechnicalIndicators.calculate_atr(
-                            historical_data['high'],
-                            historical_data['low'],
-                            historical_data['close']
-                        ).iloc[-1]
-                        
-                        new_stop = self.risk_manager.update_trailing_stop(symbol, current_price, atr)
-                        if new_stop:
-                            logger.info(f"Updated trailing stop for {symbol}: {new_stop}")
+            open_positions = self.risk_manager.open_positions
+            
+            tracked = len(self._id_sym)
+            if tracked:
+                closed = np.fromiter(
+                    (symbol not in open_positions for symbol in self._id_sym), dtype=np.bool_, count=tracked
+                )
+                self._atr[:tracked][closed] = np.nan
+                self._prev_close[:tracked][closed] = np.nan
+                self._trailing_stop[:tracked][closed] = np.nan
+                for symbol_id in np.flatnonzero(closed):
+                    self._bar_time[symbol_id] = None
+            
+            if not open_positions:
+                return
+            
+            # One multi-symbol quote request instead of one per open position
+            prices = await asyncio.to_thread(self.data_manager.get_current_prices, list(open_positions))
+            symbols = [symbol for symbol in open_positions if prices.get(symbol)]
+            # Assign ids here on the event loop so worker threads only ever write their own slot
+            symbol_ids = [self._id(symbol) for symbol in symbols]
+            semaphore = asyncio.Semaphore(self.trailing_stop_concurrency)
+            
+            async def bounded_fetch(symbol: str, symbol_id: int):
+                async with semaphore:
+                    return await self._fetch_trailing_stop_bar(symbol, symbol_id)
+            
+            results = await asyncio.gather(
+                *(bounded_fetch(symbol, symbol_id) for symbol, symbol_id in zip(symbols, symbol_ids)),
+                return_exceptions=True
+            )
+            
+            rows = []
+            for symbol, symbol_id, result in zip(symbols, symbol_ids, results):
+                if isinstance(result, Exception):
+                    logger.error("Error updating trailing stop for %s: %s", symbol, result)
+                elif result is not False and symbol in open_positions:
+                    rows.append((symbol, symbol_id, prices[symbol], result))
+            
+            if rows:
+                self._apply_trailing_stops(rows)
         
         except Exception as e:
-            logger.error(f"Error updating trailing stops: {e}")
+            logger.error("Error updating trailing stops: %s", e)
+    
+    async def _fetch_trailing_stop_bar(self, symbol: str, symbol_id: int):
+        """Fetch the newest completed stored bar (or None) for one open position, seeding its ATR on first use
+        
+        Returns False when the ATR cannot be seeded yet.
+        """
+        if np.isnan(self._atr[symbol_id]) and not await asyncio.to_thread(self._seed_atr, symbol, symbol_id):
+            return False
+        
+        # Read after seeding: the seed may store newer bars, and its ATR already covers them
+        return await asyncio.to_thread(self.data_manager.get_last_completed_ohlc, symbol)
+    
+    def _seed_atr(self, symbol: str, symbol_id: int) -> bool:
+        """Seed the cached Wilder ATR for a symbol from a month of completed bars"""
+        historical_data = self.data_manager.get_historical_data(symbol, period="1mo")
+        if len(historical_data) < 2:
+            return False
+        
+        # The last row is the bar still in progress; stop at the bar get_last_completed_ohlc returns
+        high, low, close, _ = TechnicalIndicators.to_ohlcv_arrays(historical_data.iloc[:-1])
+        atr = TechnicalIndicators.calculate_atr(high, low, close, self.atr_period)[-1]
+        if np.isnan(atr):
+            return False
+        
+        self._atr[symbol_id] = atr
+        return True
+    
+    def _apply_trailing_stops(self, rows: List[tuple]):
+        """Run the batch ATR/trailing-stop kernel over (symbol, id, price, bar) rows and store the results"""
+        open_positions = self.risk_manager.open_positions
+        count = len(rows)
+        
+        ids = np.fromiter((row[1] for row in rows), dtype=np.intp, count=count)
+        prices = np.fromiter((row[2] for row in rows), dtype=np.float64, count=count)
+        directions = np.fromiter(
+            (1.0 if open_positions[row[0]]['side'].lower() == 'buy' else -1.0 for row in rows),
+            dtype=np.float64,
+            count=count
+        )
+        highs = np.full(count, np.nan)
+        lows = np.full(count, np.nan)
+        advanced = np.zeros(count, dtype=np.bool_)
+        
+        for i, (_, symbol_id, _, bar) in enumerate(rows):
+            last_bar_time = self._bar_time[symbol_id]
+            if bar is not None and last_bar_time is not None:
+                highs[i], lows[i] = bar[1], bar[2]
+                advanced[i] = bar[0] != last_bar_time
+        
+        # Fancy indexing copies, so the kernel gets contiguous per-batch buffers
+        prev_stops = self._trailing_stop[ids]
+        # A position without a stop yet was (re)opened since its slot was last written
+        reopened = np.fromiter(
+            ('stop_loss' not in open_positions[row[0]] for row in rows), dtype=np.bool_, count=count
+        )
+        prev_stops[reopened] = np.nan
+        new_atrs, new_stops = _update_all(
+            self._atr[ids], highs, lows, self._prev_close[ids], advanced, prev_stops, prices, directions,
+            float(self.risk_manager.atr_multiplier), self.atr_period
+        )
+        self._atr[ids] = new_atrs
+        self._trailing_stop[ids] = new_stops
+        
+        for i, (symbol, symbol_id, _, bar) in enumerate(rows):
+            if bar is not None:
+                self._bar_time[symbol_id] = bar[0]
+                self._prev_close[symbol_id] = bar[3]
+            
+            if new_stops[i] != prev_stops[i]:
+                new_stop = float(new_stops[i])
+                open_positions[symbol]['stop_loss'] = new_stop
+                logger.info("Updated trailing stop for %s: %s", symbol, new_stop)
     
     async def _cancel_open_orders(self):
         """Cancel all open orders"""
         try:
-            orders = self.robinhood_client.get_orders(limit=50)
-            for order in orders:
-                if order.get('state') == 'open':
-                    self.robinhood_client.cancel_order(order['id'])
-                    logger.info(f"Cancelled order: {order['id']}")
+            orders = await self.robinhood_client.get_orders(limit=50)
+            open_orders = [order for order in orders if order.get('state') == 'open']
+            semaphore = asyncio.Semaphore(self.cancel_concurrency)
+            
+            async def cancel(order_id: str):
+                async with semaphore:
+                    await self.robinhood_client.cancel_order(order_id)
+                logger.info("Cancelled order: %s", order_id)
+            
+            results = await asyncio.gather(
+                *(cancel(order['id']) for order in open_orders), return_exceptions=True
+            )
+            
+            for order, result in zip(open_orders, results):
+                if isinstance(result, Exception):
+                    logger.error("Error cancelling order %s: %s", order['id'], result)
         except Exception as e:
-            logger.error(f"Error cancelling orders: {e}")
+            logger.error("Error cancelling orders: %s", e)
     
     def get_status(self) -> Dict[str, Any]:
         """Get current bot status"""
         return {
             'is_running': self.is_running,
             'symbols': self.strategy_engine.symbols,
-            'last_trade_times': self.last_trade_time,
-            'total_trades': len(self.trade_history),
+            'last_trade_times': self.last_trade_time_wall,
+            'total_trades': self.performance_metrics['total_trades'],
             'open_positions': len(self.risk_manager.open_positions),
             'performance_metrics': self.performance_metrics,
             'risk_metrics': self.risk_manager.get_risk_metrics(),
             'strategy_status': self.strategy_engine.get_strategy_status()
         }
     
-    def get_portfolio(self) -> Dict[str, Any]:
+    async def get_portfolio(self) -> Dict[str, Any]:
         """Get current portfolio information"""
         try:
-            account_info = self.robinhood_client.get_account()
-            holdings = self.robinhood_client.get_holdings()
+            account_info, holdings = await asyncio.gather(
+                self.robinhood_client.get_account(), self.robinhood_client.get_holdings()
+            )
             
             portfolio = {
                 'account_info': account_info,
@@ -268,12 +572,12 @@ class TradingBot:
             return portfolio
         
         except Exception as e:
-            logger.error(f"Error getting portfolio: {e}")
+            logger.error("Error getting portfolio: %s", e)
             return {}
     
-    def get_trade_history(self, limit: int = 50) -> List[Dict]:
+    def get_trade_history(self, limit: int = 50) -> List[TradeRecord]:
         """Get recent trade history"""
-        return self.trade_history[-limit:] if self.trade_history else []
+        return list(islice(self.trade_history, max(0, len(self.trade_history) - limit), None))
     
     async def manual_trade(
         self, 
@@ -294,24 +598,29 @@ class TradingBot:
             if not is_valid:
                 return {'status': 'error', 'message': reason}
             
-            if order_type == "market":
-                order_result = self.robinhood_client.create_market_order(symbol, side, amount)
-            else:
+            if order_type != "market":
                 return {'status': 'error', 'message': 'Only market orders supported for manual trades'}
             
-            trade_record = {
-                'timestamp': datetime.now(),
-                'symbol': symbol,
-                'side': side,
-                'quantity': quantity,
-                'price': current_price,
-                'quote_amount': amount,
-                'order_id': order_result.get('id'),
-                'type': 'manual'
-            }
+            handler = self._trade_handlers.get(side)
+            if handler is None:
+                return {'status': 'error', 'message': f'Unsupported side: {side}'}
+            
+            order_result = await handler(symbol, amount)
+            
+            trade_record = TradeRecord(
+                timestamp=datetime.now(),
+                symbol=symbol,
+                side=side,
+                quantity=quantity,
+                price=current_price,
+                quote_amount=amount,
+                order_id=order_result.get('id'),
+                type='manual'
+            )
             
             self.trade_history.append(trade_record)
             self.risk_manager.record_trade(symbol, side, quantity, current_price, "open")
+            self.performance_metrics['total_trades'] += 1
             
             return {
                 'status': 'success',
@@ -320,5 +629,5 @@ class TradingBot:
             }
         
         except Exception as e:
-            logger.error(f"Manual trade failed: {e}")
+            logger.error("Manual trade failed: %s", e)
             return {'status': 'error', 'message': str(e)}